@@ -1,6 +1,12 @@
 """Tests for CLI functions."""
+import os
+
 import pytest
-from deepagent_code.cli import parse_agent_spec
+from deepagent_code.cli import (
+    handle_interrupt_input,
+    load_graph_from_file,
+    parse_agent_spec,
+)
 
 
 class TestParseAgentSpec:
@@ -65,3 +71,75 @@ class TestParseAgentSpec:
 
         assert file_path == "agent.py"
         assert var_name == "my_custom_graph_v2"
+
+
+class TestLoadGraphFromFile:
+    """Tests for load_graph_from_file function."""
+
+    def test_missing_file(self, tmp_path):
+        """Test error when the file doesn't exist."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            load_graph_from_file(str(tmp_path / "missing.py"))
+
+    def test_loads_graph_variable(self, tmp_path):
+        """Test loading a graph variable from a file."""
+        agent_file = tmp_path / "agent.py"
+        agent_file.write_text("graph = {'name': 'test'}\n")
+
+        graph = load_graph_from_file(str(agent_file))
+
+        assert graph == {"name": "test"}
+
+    def test_cached_module_reused(self, tmp_path):
+        """Test that an unchanged file is not re-executed on reload."""
+        agent_file = tmp_path / "agent.py"
+        agent_file.write_text("graph = object()\n")
+
+        first = load_graph_from_file(str(agent_file))
+        second = load_graph_from_file(str(agent_file))
+
+        assert first is second
+
+    def test_modified_file_reloaded(self, tmp_path):
+        """Test that a modified file invalidates the cache."""
+        agent_file = tmp_path / "agent.py"
+        agent_file.write_text("graph = 'v1'\n")
+
+        assert load_graph_from_file(str(agent_file)) == "v1"
+
+        agent_file.write_text("graph = 'v2'\n")
+        # Ensure the mtime actually changes (coarse filesystem timestamps)
+        stat = agent_file.stat()
+        os.utime(agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert load_graph_from_file(str(agent_file)) == "v2"
+
+
+class TestHandleInterruptInput:
+    """Tests for handle_interrupt_input auto-decision mode."""
+
+    def test_auto_approve(self, monkeypatch):
+        """Test auto-approve via DEEPAGENT_AUTO_DECISION."""
+        monkeypatch.setenv("DEEPAGENT_AUTO_DECISION", "approve")
+
+        decisions = handle_interrupt_input(num_actions=3)
+
+        assert decisions == [{"type": "approve"}] * 3
+
+    def test_auto_reject(self, monkeypatch):
+        """Test auto-reject via DEEPAGENT_AUTO_DECISION."""
+        monkeypatch.setenv("DEEPAGENT_AUTO_DECISION", "reject")
+
+        decisions = handle_interrupt_input(num_actions=2)
+
+        assert decisions == [{"type": "reject"}] * 2
+
+    def test_auto_json_decision(self, monkeypatch):
+        """Test custom JSON decision via DEEPAGENT_AUTO_DECISION."""
+        monkeypatch.setenv(
+            "DEEPAGENT_AUTO_DECISION", '{"type": "edit", "args": {"x": 1}}'
+        )
+
+        decisions = handle_interrupt_input(num_actions=1)
+
+        assert decisions == [{"type": "edit", "args": {"x": 1}}]